@@ -12,37 +12,79 @@ Requires ORCHESTRATOR_URL and DATA_SERVICE_URL (env or .env in config/).
 
 from __future__ import annotations
 
+import inspect
 import json
 import os
+import re
 import sys
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
 
 # Load .env from config/ if present
 _config_dir = Path(__file__).resolve().parent.parent / "config"
 _env_file = _config_dir / ".env"
+_ENV_LINE = re.compile(r"^[ \t]*([^#\s=][^=\n]*?)[ \t]*=([^\n]*)$", re.MULTILINE)
 if _env_file.exists():
-    with open(_env_file) as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith("#") and "=" in line:
-                k, v = line.split("=", 1)
-                os.environ.setdefault(k.strip(), v.strip().strip('"').strip("'"))
+    for m in _ENV_LINE.finditer(_env_file.read_text()):
+        os.environ.setdefault(m.group(1), m.group(2).strip().strip('"').strip("'"))
 
 import anyio
-import requests
+import httpx
 from mcp import types
 from mcp.server.lowlevel import Server
 
 ORCHESTRATOR_URL = os.environ.get("ORCHESTRATOR_URL", "http://localhost:8000").rstrip("/")
 DATA_SERVICE_URL = os.environ.get("DATA_SERVICE_URL", "http://localhost:8001").rstrip("/")
 
+# One pooled client for the process: keep-alive connections to the orchestrator and data service
+# are reused across tool calls instead of a fresh TCP connection per request. httpx advertises
+# Accept-Encoding for every decoder it has (gzip, deflate, plus zstd via the [zstd] extra) and
+# decompresses transparently, so compressed data-service responses need no handling here.
+# Redirects are followed, as requests did.
+_CLIENT = httpx.AsyncClient(
+    follow_redirects=True,
+    timeout=httpx.Timeout(120.0),
+    limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+)
+
+# Multi-symbol tool calls: cap on symbols per call (matches the data service's bulk endpoint) and on
+# in-flight multi-symbol requests across all calls. The limiter is shared process-wide and kept at half
+# the client's connection limit, leaving headroom for single-symbol and orchestrator calls, so
+# concurrent fan-outs queue here instead of on the pool (where the tail would hit PoolTimeout).
+_MAX_SYMBOLS = 100
+_FANOUT_LIMIT = 16
+_fanout_limiter: anyio.CapacityLimiter | None = None
+
+
+def _get_fanout_limiter() -> anyio.CapacityLimiter:
+    # Created on first use so it belongs to the running event loop.
+    global _fanout_limiter
+    if _fanout_limiter is None:
+        _fanout_limiter = anyio.CapacityLimiter(_FANOUT_LIMIT)
+    return _fanout_limiter
+
 
 def _text(content: str) -> list[types.ContentBlock]:
     return [types.TextContent(type="text", text=content)]
 
 
-def _tool_run_backtest(
+class _NotJSONError(httpx.HTTPError):
+    """A 2xx response whose body is empty or not JSON, so it cannot be passed through as-is."""
+
+    def __init__(self, response: httpx.Response) -> None:
+        content_type = response.headers.get("content-type") or "no content type"
+        super().__init__(f"Expected a JSON body from {response.url}, got {content_type} ({len(response.content)} bytes)")
+        self.response = response
+
+
+def _response_text(e: httpx.HTTPError) -> str:
+    response = getattr(e, "response", None)
+    return getattr(response, "text", "")
+
+
+async def _tool_run_backtest(
     symbol: str = "SPY",
     data_source: str = "data_service",
     initial_cash: float = 100_000.0,
@@ -52,7 +94,7 @@ def _tool_run_backtest(
 ) -> list[types.ContentBlock]:
     """Call orchestrator POST /backtest."""
     try:
-        r = requests.post(
+        r = await _CLIENT.post(
             f"{ORCHESTRATOR_URL}/backtest",
             json={
                 "symbol": symbol.upper(),
@@ -65,63 +107,94 @@ def _tool_run_backtest(
             timeout=60,
         )
         r.raise_for_status()
-        return _text(json.dumps(r.json(), indent=2))
-    except requests.RequestException as e:
-        return _text(f"Error calling orchestrator /backtest: {e}\nResponse: {getattr(e.response, 'text', '')}")
+        return _text(r.text)
+    except httpx.HTTPError as e:
+        return _text(f"Error calling orchestrator /backtest: {e}\nResponse: {_response_text(e)}")
+
+
+async def _get_symbol_text(endpoint: str, symbol: str, limit: int) -> str:
+    r = await _CLIENT.get(
+        f"{DATA_SERVICE_URL}/{endpoint}/{symbol.upper()}",
+        params={"limit": limit},
+        timeout=30,
+    )
+    r.raise_for_status()
+    media_type = r.headers.get("content-type", "").split(";", 1)[0].strip().lower()
+    if not r.content or not (media_type == "application/json" or media_type.endswith("+json")):
+        raise _NotJSONError(r)
+    return r.text
+
+
+async def _tool_symbol_data(
+    endpoint: str,
+    symbol: str | None,
+    symbols: list[str] | None,
+    limit: int,
+) -> list[types.ContentBlock]:
+    """Call data service GET /{endpoint}/{symbol}. With symbols, fetch all concurrently and key the result by symbol."""
+    if symbols:
+        if symbol:
+            symbols = [symbol, *symbols]
+        symbols = list(dict.fromkeys(s.upper() for s in symbols))
+        if len(symbols) > _MAX_SYMBOLS:
+            raise ValueError(f"get_{endpoint} accepts at most {_MAX_SYMBOLS} symbols")
+        results: dict[str, str] = {}
+        limiter = _get_fanout_limiter()
+
+        async def fetch(s: str) -> None:
+            async with limiter:
+                try:
+                    results[s] = await _get_symbol_text(endpoint, s, limit)
+                except httpx.HTTPError as e:
+                    results[s] = json.dumps({"error": str(e), "response": _response_text(e)})
+
+        async with anyio.create_task_group() as tg:
+            for s in symbols:
+                tg.start_soon(fetch, s)
+        # Splice the upstream JSON bodies in as-is rather than parsing and re-serializing them.
+        return _text("{" + ", ".join(f"{json.dumps(s)}: {results[s]}" for s in symbols) + "}")
+    if not symbol:
+        raise ValueError(f"get_{endpoint} requires 'symbol' or 'symbols'")
+    try:
+        return _text(await _get_symbol_text(endpoint, symbol, limit))
+    except httpx.HTTPError as e:
+        return _text(f"Error calling data service /{endpoint}: {e}\nResponse: {_response_text(e)}")
 
 
-def _tool_get_prices(
-    symbol: str,
+async def _tool_get_prices(
+    symbol: str | None = None,
+    symbols: list[str] | None = None,
     limit: int = 100,
 ) -> list[types.ContentBlock]:
     """Call data service GET /prices/{symbol}. Returns OHLCV rows."""
-    try:
-        r = requests.get(
-            f"{DATA_SERVICE_URL}/prices/{symbol.upper()}",
-            params={"limit": min(limit, 1000)},
-            timeout=30,
-        )
-        r.raise_for_status()
-        return _text(json.dumps(r.json(), indent=2))
-    except requests.RequestException as e:
-        return _text(f"Error calling data service /prices: {e}\nResponse: {getattr(e.response, 'text', '')}")
+    return await _tool_symbol_data("prices", symbol, symbols, min(limit, 1000))
 
 
-def _tool_get_news(symbol: str, limit: int = 20) -> list[types.ContentBlock]:
+async def _tool_get_news(
+    symbol: str | None = None,
+    symbols: list[str] | None = None,
+    limit: int = 20,
+) -> list[types.ContentBlock]:
     """Call data service GET /news/{symbol}. Returns recent news for the symbol."""
-    try:
-        r = requests.get(
-            f"{DATA_SERVICE_URL}/news/{symbol.upper()}",
-            params={"limit": min(limit, 500)},
-            timeout=30,
-        )
-        r.raise_for_status()
-        return _text(json.dumps(r.json(), indent=2))
-    except requests.RequestException as e:
-        return _text(f"Error calling data service /news: {e}\nResponse: {getattr(e.response, 'text', '')}")
+    return await _tool_symbol_data("news", symbol, symbols, min(limit, 500))
 
 
-def _tool_get_insider(symbol: str, limit: int = 20) -> list[types.ContentBlock]:
+async def _tool_get_insider(
+    symbol: str | None = None,
+    symbols: list[str] | None = None,
+    limit: int = 20,
+) -> list[types.ContentBlock]:
     """Call data service GET /insider/{symbol}. Returns recent insider transactions."""
-    try:
-        r = requests.get(
-            f"{DATA_SERVICE_URL}/insider/{symbol.upper()}",
-            params={"limit": min(limit, 500)},
-            timeout=30,
-        )
-        r.raise_for_status()
-        return _text(json.dumps(r.json(), indent=2))
-    except requests.RequestException as e:
-        return _text(f"Error calling data service /insider: {e}\nResponse: {getattr(e.response, 'text', '')}")
+    return await _tool_symbol_data("insider", symbol, symbols, min(limit, 500))
 
 
-def _tool_run_decision(
+async def _tool_run_decision(
     execution_score: float = 0.88,
     include_guardian: bool = False,
 ) -> list[types.ContentBlock]:
     """Run the full orchestrator pipeline: regime → portfolio → allocation (optional guardian). Uses orchestrator defaults for paths."""
     try:
-        r = requests.post(
+        r = await _CLIENT.post(
             f"{ORCHESTRATOR_URL}/decision",
             json={
                 "execution_score": execution_score,
@@ -130,9 +203,150 @@ def _tool_run_decision(
             timeout=120,
         )
         r.raise_for_status()
-        return _text(json.dumps(r.json(), indent=2))
-    except requests.RequestException as e:
-        return _text(f"Error calling orchestrator /decision: {e}\nResponse: {getattr(e.response, 'text', '')}")
+        return _text(r.text)
+    except httpx.HTTPError as e:
+        return _text(f"Error calling orchestrator /decision: {e}\nResponse: {_response_text(e)}")
+
+
+async def _tool_traverse_skill_graph(
+    task_context: str,
+    agent_name: str | None = None,
+    top_k: int = 5,
+) -> list[types.ContentBlock]:
+    """Query the skill graph for knowledge nodes relevant to the task context."""
+    from qtos_mcp.skill_graph_tool import traverse_skill_graph_tool
+
+    return _text(traverse_skill_graph_tool(task_context=task_context, agent_name=agent_name, top_k=top_k))
+
+
+def _str_list(value: Any) -> list[str]:
+    return [value] if isinstance(value, str) else [str(v) for v in value]
+
+
+_Handler = Callable[..., Awaitable[list[types.ContentBlock]]]
+_Coercers = dict[str, Callable[[Any], Any]]
+
+_SYMBOL_ARGS: _Coercers = {"symbol": str, "symbols": _str_list, "limit": int}
+_SYMBOL_SCHEMA = {"type": "string", "description": "Ticker symbol (one of symbol/symbols is required)"}
+_SYMBOLS_SCHEMA = {
+    "type": "array",
+    "items": {"type": "string"},
+    "maxItems": _MAX_SYMBOLS,
+    "description": (
+        "Several ticker symbols, fetched concurrently; result is keyed by symbol "
+        "(one of symbol/symbols is required; symbol, if also given, is included)"
+    ),
+}
+
+
+def _entry(handler: _Handler, coercers: _Coercers) -> tuple[_Handler, _Coercers, frozenset[str]]:
+    params = inspect.signature(handler).parameters.values()
+    return handler, coercers, frozenset(p.name for p in params if p.default is p.empty)
+
+
+# Tool name -> (handler, argument coercers, required argument names). Only listed arguments are
+# passed on, coerced the same way the tool schemas describe them; unknown keys are dropped and
+# omitted/null ones fall back to the handler defaults.
+_DISPATCH: dict[str, tuple[_Handler, _Coercers, frozenset[str]]] = {
+    "run_backtest": _entry(
+        _tool_run_backtest,
+        {
+            "symbol": str,
+            "data_source": str,
+            "initial_cash": float,
+            "quantity": float,
+            "strategy_type": str,
+            "period": str,
+        },
+    ),
+    "get_prices": _entry(_tool_get_prices, _SYMBOL_ARGS),
+    "get_news": _entry(_tool_get_news, _SYMBOL_ARGS),
+    "get_insider": _entry(_tool_get_insider, _SYMBOL_ARGS),
+    "run_decision": _entry(_tool_run_decision, {"execution_score": float, "include_guardian": bool}),
+    "traverse_skill_graph": _entry(
+        _tool_traverse_skill_graph,
+        {"task_context": str, "agent_name": str, "top_k": int},
+    ),
+}
+
+# Tool definitions are static; built once at import and returned as-is from list_tools.
+_TOOLS: list[types.Tool] = [
+    types.Tool(
+        name="run_backtest",
+        description="Run a backtest for a symbol using qtos-core. Data from data_service or csv. Returns metrics (PnL, Sharpe, CAGR, max drawdown).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbol": {"type": "string", "description": "Ticker symbol (e.g. SPY, AAPL)", "default": "SPY"},
+                "data_source": {"type": "string", "description": "Data source: 'data_service' or 'csv'", "default": "data_service"},
+                "initial_cash": {"type": "number", "description": "Starting portfolio value", "default": 100000},
+                "quantity": {"type": "number", "description": "Shares to buy (buy_and_hold)", "default": 50},
+                "strategy_type": {"type": "string", "description": "Strategy; currently only buy_and_hold", "default": "buy_and_hold"},
+                "period": {"type": "string", "description": "Lookback when data_service (e.g. 1y, 6mo)", "default": "1y"},
+            },
+        },
+    ),
+    types.Tool(
+        name="get_prices",
+        description="Get OHLCV price history for one or more symbols from the data service.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbol": _SYMBOL_SCHEMA,
+                "symbols": _SYMBOLS_SCHEMA,
+                "limit": {"type": "integer", "description": "Max rows to return", "default": 100},
+            },
+        },
+    ),
+    types.Tool(
+        name="get_news",
+        description="Get recent news for one or more symbols from the data service.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbol": _SYMBOL_SCHEMA,
+                "symbols": _SYMBOLS_SCHEMA,
+                "limit": {"type": "integer", "description": "Max items", "default": 20},
+            },
+        },
+    ),
+    types.Tool(
+        name="get_insider",
+        description="Get recent insider transactions for one or more symbols from the data service.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbol": _SYMBOL_SCHEMA,
+                "symbols": _SYMBOLS_SCHEMA,
+                "limit": {"type": "integer", "description": "Max items", "default": 20},
+            },
+        },
+    ),
+    types.Tool(
+        name="run_decision",
+        description="Run the full QuantTradingOS pipeline: regime → portfolio → execution-discipline → allocation (optional guardian). Uses default paths on the orchestrator.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "execution_score": {"type": "number", "description": "Execution discipline score 0-1", "default": 0.88},
+                "include_guardian": {"type": "boolean", "description": "Include capital guardian guardrails", "default": False},
+            },
+        },
+    ),
+    types.Tool(
+        name="traverse_skill_graph",
+        description="Query the QuantTradingOS skill graph for relevant knowledge nodes given a task context.",
+        inputSchema={
+            "type": "object",
+            "required": ["task_context"],
+            "properties": {
+                "task_context": {"type": "string", "description": "Natural language description of what you need to know"},
+                "agent_name": {"type": "string", "description": "Optional — filter to a specific agent's knowledge (e.g. Market-Regime-Agent)"},
+                "top_k": {"type": "integer", "description": "Number of nodes to return", "default": 5},
+            },
+        },
+    ),
+]
 
 
 def _create_app() -> Server:
@@ -140,116 +354,24 @@ def _create_app() -> Server:
 
     @app.list_tools()
     async def list_tools() -> list[types.Tool]:
-        return [
-            types.Tool(
-                name="run_backtest",
-                description="Run a backtest for a symbol using qtos-core. Data from data_service or csv. Returns metrics (PnL, Sharpe, CAGR, max drawdown).",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "symbol": {"type": "string", "description": "Ticker symbol (e.g. SPY, AAPL)", "default": "SPY"},
-                        "data_source": {"type": "string", "description": "Data source: 'data_service' or 'csv'", "default": "data_service"},
-                        "initial_cash": {"type": "number", "description": "Starting portfolio value", "default": 100000},
-                        "quantity": {"type": "number", "description": "Shares to buy (buy_and_hold)", "default": 50},
-                        "strategy_type": {"type": "string", "description": "Strategy; currently only buy_and_hold", "default": "buy_and_hold"},
-                        "period": {"type": "string", "description": "Lookback when data_service (e.g. 1y, 6mo)", "default": "1y"},
-                    },
-                },
-            ),
-            types.Tool(
-                name="get_prices",
-                description="Get OHLCV price history for a symbol from the data service.",
-                inputSchema={
-                    "type": "object",
-                    "required": ["symbol"],
-                    "properties": {
-                        "symbol": {"type": "string", "description": "Ticker symbol"},
-                        "limit": {"type": "integer", "description": "Max rows to return", "default": 100},
-                    },
-                },
-            ),
-            types.Tool(
-                name="get_news",
-                description="Get recent news for a symbol from the data service.",
-                inputSchema={
-                    "type": "object",
-                    "required": ["symbol"],
-                    "properties": {
-                        "symbol": {"type": "string", "description": "Ticker symbol"},
-                        "limit": {"type": "integer", "description": "Max items", "default": 20},
-                    },
-                },
-            ),
-            types.Tool(
-                name="get_insider",
-                description="Get recent insider transactions for a symbol from the data service.",
-                inputSchema={
-                    "type": "object",
-                    "required": ["symbol"],
-                    "properties": {
-                        "symbol": {"type": "string", "description": "Ticker symbol"},
-                        "limit": {"type": "integer", "description": "Max items", "default": 20},
-                    },
-                },
-            ),
-            types.Tool(
-                name="run_decision",
-                description="Run the full QuantTradingOS pipeline: regime → portfolio → execution-discipline → allocation (optional guardian). Uses default paths on the orchestrator.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "execution_score": {"type": "number", "description": "Execution discipline score 0-1", "default": 0.88},
-                        "include_guardian": {"type": "boolean", "description": "Include capital guardian guardrails", "default": False},
-                    },
-                },
-            ),
-            types.Tool(
-                name="traverse_skill_graph",
-                description="Query the QuantTradingOS skill graph for relevant knowledge nodes given a task context.",
-                inputSchema={
-                    "type": "object",
-                    "required": ["task_context"],
-                    "properties": {
-                        "task_context": {"type": "string", "description": "Natural language description of what you need to know"},
-                        "agent_name": {"type": "string", "description": "Optional — filter to a specific agent's knowledge (e.g. Market-Regime-Agent)"},
-                        "top_k": {"type": "integer", "description": "Number of nodes to return", "default": 5},
-                    },
-                },
-            ),
-        ]
+        return _TOOLS
 
     @app.call_tool()
     async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.ContentBlock]:
-        args = arguments or {}
-        if name == "run_backtest":
-            return _tool_run_backtest(
-                symbol=args.get("symbol", "SPY"),
-                data_source=args.get("data_source", "data_service"),
-                initial_cash=float(args.get("initial_cash", 100_000)),
-                quantity=float(args.get("quantity", 50)),
-                strategy_type=args.get("strategy_type", "buy_and_hold"),
-                period=args.get("period", "1y"),
-            )
-        if name == "get_prices":
-            return _tool_get_prices(symbol=args["symbol"], limit=int(args.get("limit", 100)))
-        if name == "get_news":
-            return _tool_get_news(symbol=args["symbol"], limit=int(args.get("limit", 20)))
-        if name == "get_insider":
-            return _tool_get_insider(symbol=args["symbol"], limit=int(args.get("limit", 20)))
-        if name == "run_decision":
-            return _tool_run_decision(
-                execution_score=float(args.get("execution_score", 0.88)),
-                include_guardian=bool(args.get("include_guardian", False)),
-            )
-        if name == "traverse_skill_graph":
-            from qtos_mcp.skill_graph_tool import traverse_skill_graph_tool
-            out = traverse_skill_graph_tool(
-                task_context=args["task_context"],
-                agent_name=args.get("agent_name"),
-                top_k=int(args.get("top_k", 5)),
-            )
-            return _text(out)
-        raise ValueError(f"Unknown tool: {name}")
+        entry = _DISPATCH.get(name)
+        if entry is None:
+            raise ValueError(f"Unknown tool: {name}")
+        handler, coercers, required = entry
+        try:
+            kwargs = {
+                k: coercers[k](v) for k, v in (arguments or {}).items() if k in coercers and v is not None
+            }
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid arguments for {name}: {e}") from e
+        missing = required - kwargs.keys()
+        if missing:
+            raise ValueError(f"Invalid arguments for {name}: missing {', '.join(sorted(missing))}")
+        return await handler(**kwargs)
 
     return app
 
@@ -261,7 +383,10 @@ def _run_stdio() -> None:
 
     async def arun() -> None:
         async with stdio_server() as (read_stream, write_stream):
-            await app.run(read_stream, write_stream, app.create_initialization_options())
+            try:
+                await app.run(read_stream, write_stream, app.create_initialization_options())
+            finally:
+                await _CLIENT.aclose()
 
     anyio.run(arun)
 
@@ -281,8 +406,16 @@ def _run_sse(port: int) -> None:
             await app.run(streams[0], streams[1], app.create_initialization_options())
         return Response()
 
+    @asynccontextmanager
+    async def lifespan(_app: Starlette) -> AsyncIterator[None]:
+        try:
+            yield
+        finally:
+            await _CLIENT.aclose()
+
     starlette_app = Starlette(
         debug=True,
+        lifespan=lifespan,
         routes=[
             Route("/sse", endpoint=handle_sse, methods=["GET"]),
             Mount("/messages/", app=sse.handle_post_message),